@@ -11,17 +11,19 @@ class CMIP6_Atmosphere_CMORiser(CMIP6_CMORiser):
     """
 
     def select_and_process_variables(self):
+        mapping = self.mapping[self.cmor_name]
+        # Map each output dimension name to the first input dimension using it
+        input_dims = {}
+        for k, val in mapping["dimensions"].items():
+            input_dims.setdefault(val, k)
+
         # Find all required bounds variables
         bnds_required = []
         bounds_rename_map = {}
         for dim, v in self.vocab.axes.items():
             if v.get("must_have_bounds") == "yes":
                 # Find the input dimension name that maps to this output name
-                input_dim = None
-                for k, val in self.mapping[self.cmor_name]["dimensions"].items():
-                    if val == v["out_name"]:
-                        input_dim = k
-                        break
+                input_dim = input_dims.get(v["out_name"])
                 if input_dim is None:
                     raise KeyError(
                         f"Can't find input dimension mapping for output dimension '{v['out_name']}'."
@@ -31,8 +33,8 @@ class CMIP6_Atmosphere_CMORiser(CMIP6_CMORiser):
                 bnds_required.append(bnds_var)
 
         # Select input variables
-        input_vars = self.mapping[self.cmor_name]["model_variables"]
-        calc = self.mapping[self.cmor_name]["calculation"]
+        input_vars = mapping["model_variables"]
+        calc = mapping["calculation"]
 
         required_vars = set(input_vars + bnds_required)
         self.load_dataset(required_vars=required_vars)
@@ -60,7 +62,7 @@ class CMIP6_Atmosphere_CMORiser(CMIP6_CMORiser):
             raise ValueError(f"Unsupported calculation type: {calc['type']}")
 
         # Rename dimensions according to the CMOR vocabulary
-        dim_rename = self.mapping[self.cmor_name]["dimensions"]
+        dim_rename = mapping["dimensions"]
         dims_to_rename = {k: v for k, v in dim_rename.items() if k in self.ds.dims}
         self.ds = self.ds.rename(dims_to_rename)
 
@@ -69,12 +71,13 @@ class CMIP6_Atmosphere_CMORiser(CMIP6_CMORiser):
         if coords_to_rename:
             self.ds = self.ds.rename(coords_to_rename)
 
-        # Rename bounds variables
-        for bnds_var, out_bnds_name in bounds_rename_map.items():
-            if bnds_var in self.ds:
-                self.ds = self.ds.rename({bnds_var: out_bnds_name})
-            elif bnds_var in self.ds.coords:
-                self.ds = self.ds.rename({bnds_var: out_bnds_name})
+        # Rename bounds variables in one pass
+        bnds_to_rename = {
+            k: v for k, v in bounds_rename_map.items() if k in self.ds.variables
+        }
+        if bnds_to_rename:
+            self.ds = self.ds.rename(bnds_to_rename)
+        for out_bnds_name in bounds_rename_map.values():
             # trim 'time' dimention of lat_bnds and lon_bnds
             if "time" not in out_bnds_name and "time" in self.ds[out_bnds_name].coords:
                 self.ds[out_bnds_name] = (
@@ -122,20 +125,16 @@ class CMIP6_Atmosphere_CMORiser(CMIP6_CMORiser):
             {k: v for k, v in cmor_attrs.items() if v not in (None, "")}
         )
         var_type = cmor_attrs.get("type", "double")
-        self.ds[self.cmor_name] = self.ds[self.cmor_name].astype(
-            self.type_mapping.get(var_type, np.float64)
-        )
+        target_dtype = self.type_mapping.get(var_type, self.type_mapping["double"])
+        if self.ds[self.cmor_name].dtype != target_dtype:
+            self.ds[self.cmor_name] = self.ds[self.cmor_name].astype(target_dtype)
 
         try:
             if cmor_attrs.get("valid_min") not in (None, "") and cmor_attrs.get(
                 "valid_max"
             ) not in (None, ""):
-                vmin = self.type_mapping.get(var_type, np.float64)(
-                    cmor_attrs["valid_min"]
-                )
-                vmax = self.type_mapping.get(var_type, np.float64)(
-                    cmor_attrs["valid_max"]
-                )
+                vmin = target_dtype.type(cmor_attrs["valid_min"])
+                vmax = target_dtype.type(cmor_attrs["valid_max"])
                 self._check_range(self.cmor_name, vmin, vmax)
         except ValueError as e:
             raise ValueError(
@@ -144,7 +143,9 @@ class CMIP6_Atmosphere_CMORiser(CMIP6_CMORiser):
 
         for dim, meta in self.vocab.axes.items():
             name = meta["out_name"]
-            dtype = self.type_mapping.get(meta.get("type", "double"), np.float64)
+            dtype = self.type_mapping.get(
+                meta.get("type", "double"), self.type_mapping["double"]
+            ).type
             if name in self.ds:
                 self._check_units(name, meta.get("units", ""))
                 if meta.get("standard_name") == "time":
@@ -3,7 +3,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+import dask
 import netCDF4 as nc
+import numpy as np
 import xarray as xr
 from cftime import num2date
 
@@ -23,6 +25,27 @@ class CMIP6_CMORiser:
     """
 
     type_mapping = type_mapping
+    # Dataset attributes accessible directly on the CMORiser
+    _DELEGATED = frozenset(
+        {"attrs", "coords", "data_vars", "dims", "indexes", "sizes", "variables"}
+    )
+    # Global attributes forming the DRS directories between mip_era and version
+    _DRS_KEYS = (
+        "activity_id",
+        "institution_id",
+        "source_id",
+        "experiment_id",
+        "variant_label",
+        "table_id",
+        "variable_id",
+        "grid_label",
+    )
+    # Target size in bytes of each time block written by write()
+    write_block_bytes = 1e9
+    # Largest dataset (in bytes) that write(in_memory=True) builds in memory
+    in_memory_max_bytes = 2e9
+    # Target size in bytes of the on-disk chunks used when the source has none
+    chunk_target_bytes = 2**20
 
     def __init__(
         self,
@@ -35,6 +58,9 @@ class CMIP6_CMORiser:
         validate_frequency: bool = False,
         enable_resampling: bool = False,
         resampling_method: str = "auto",
+        compression: Optional[str] = "zlib",
+        complevel: int = 1,
+        unlimited_time: bool = True,
     ):
         self.input_paths = (
             input_paths if isinstance(input_paths, list) else [input_paths]
@@ -50,14 +76,27 @@ class CMIP6_CMORiser:
         self.compound_name = compound_name
         self.enable_resampling = enable_resampling
         self.resampling_method = resampling_method
+        # Compression filter passed to netCDF4 (e.g. "zlib", or "zstd" with
+        # netCDF-C >= 4.9); None writes uncompressed output
+        self.compression = compression
+        self.complevel = complevel
+        # CMOR writes time as the unlimited (record) dimension; a fixed-size
+        # time dimension avoids extending the HDF5 chunk index on every write
+        self.unlimited_time = unlimited_time
         self.ds = None
 
     def __getitem__(self, key):
         return self.ds[key]
 
     def __getattr__(self, attr):
-        # This is only called if the attr is not found on CMORiser itself
-        return getattr(self.ds, attr)
+        # This is only called if the attr is not found on CMORiser itself.
+        # Only a fixed set of Dataset attributes is forwarded so that typos and
+        # attribute probes (hasattr, pickling) fail fast instead of reaching self.ds.
+        if attr in self._DELEGATED and self.ds is not None:
+            return getattr(self.ds, attr)
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{attr}'"
+        )
 
     def __setitem__(self, key, value):
         self.ds[key] = value
@@ -65,6 +104,26 @@ class CMIP6_CMORiser:
     def __repr__(self):
         return repr(self.ds)
 
+    @staticmethod
+    def _probe_source(path, variables) -> List[str]:
+        """
+        Inspect the first input file without going through xarray.
+
+        Returns:
+            The names of the non-dimension variables that are not in variables
+            and can be dropped on open, or an empty list if the file cannot be
+            read.
+        """
+        try:
+            with nc.Dataset(path, "r") as src:
+                return [
+                    name
+                    for name in src.variables
+                    if name not in variables and name not in src.dimensions
+                ]
+        except OSError:
+            return []
+
     def load_dataset(self, required_vars: Optional[List[str]] = None):
         """
         Load dataset from input files with optional frequency validation.
@@ -73,16 +132,42 @@ class CMIP6_CMORiser:
             required_vars: Optional list of required variables to extract
         """
 
+        required = frozenset(required_vars) if required_vars else None
+
         def _preprocess(ds):
-            return ds[list(required_vars & set(ds.data_vars))]
+            if required is None:
+                return ds
+            return ds[list(ds.data_vars.keys() & required)]
+
+        # Skip zero-byte files (e.g. left behind by interrupted transfers)
+        input_paths, empty_paths = [], []
+        for p in self.input_paths:
+            try:
+                is_empty = Path(p).stat().st_size == 0
+            except FileNotFoundError:
+                is_empty = False  # Let open_mfdataset report missing files
+            (empty_paths if is_empty else input_paths).append(p)
+        if empty_paths:
+            warnings.warn(
+                f"Skipping {len(empty_paths)} empty input file(s), which may leave "
+                f"gaps in the time series: {', '.join(map(str, empty_paths))}"
+            )
 
         # Validate frequency consistency and CMIP6 compatibility before concatenation
-        if self.validate_frequency and len(self.input_paths) > 0:
+        if self.validate_frequency and len(input_paths) > 0:
+            # Only the first two and last two files are checked: intermediate
+            # files are assumed to share their frequency. Pairs are kept so that
+            # single-timestep files still give a time step to measure.
+            validation_paths = (
+                input_paths[:2] + input_paths[-2:]
+                if len(input_paths) > 4
+                else input_paths
+            )
             try:
                 # Enhanced validation with CMIP6 frequency compatibility
                 detected_freq, resampling_required = (
                     validate_cmip6_frequency_compatibility(
-                        self.input_paths,
+                        validation_paths,
                         self.compound_name,
                         time_coord="time",
                         interactive=True,
@@ -104,13 +189,24 @@ class CMIP6_CMORiser:
                     f"Proceeding with concatenation but results may be inconsistent."
                 )
 
+        # Avoid opening variables that _preprocess would discard anyway
+        drop = (
+            self._probe_source(input_paths[0], required)
+            if input_paths and required
+            else []
+        )
+
         self.ds = xr.open_mfdataset(
-            self.input_paths,
+            input_paths,
             combine="nested",  # avoids costly dimension alignment
             concat_dim="time",
             engine="netcdf4",
             decode_cf=False,
+            drop_variables=drop,
             chunks={},
+            data_vars="minimal",  # only concatenate variables that have time
+            coords="minimal",
+            compat="override",  # skip per-file equality checks on the rest
             preprocess=_preprocess,
             parallel=True,  # <--- enables concurrent preprocessing
         )
@@ -148,9 +244,11 @@ class CMIP6_CMORiser:
 
     def sort_time_dimension(self):
         if "time" in self.ds.dims:
-            self.ds = self.ds.sortby("time")
-            # Clean up potential duplication
-            self.ds = self.ds.sel(time=~self.ds.get_index("time").duplicated())
+            # Positions of the first occurrence of each unique time, in time order:
+            # sorts and drops duplicates in a single pass
+            _, idx = np.unique(self.ds.indexes["time"].values, return_index=True)
+            if len(idx) != self.ds.sizes["time"] or (np.diff(idx) < 0).any():
+                self.ds = self.ds.isel(time=idx)
 
     def select_and_process_variables(self):
         raise NotImplementedError(
@@ -181,74 +279,78 @@ class CMIP6_CMORiser:
         if not calendar or not units:
             return
         try:
-            dates = xr.cftime_range(
-                start=units.split("since")[1].strip(), periods=3, calendar=calendar
-            )
+            dates = self.ds.indexes.get(var)
+            if not hasattr(dates, "month"):
+                # Time is still numeric (decode_cf=False). Values decoded in a
+                # calendar cannot hit its invalid dates, so only the first one is
+                # decoded to check that the calendar and units parse.
+                dates = xr.CFTimeIndex(
+                    num2date(
+                        np.asarray(self.ds[var].values[:1]),
+                        units=units,
+                        calendar=calendar,
+                    )
+                )
+            months = np.asarray(dates.month)
+            days = np.asarray(dates.day)
         except Exception as e:
             raise ValueError(f"Failed calendar check for {var}: {e}")
         if calendar in ("noleap", "365_day"):
-            for d in dates:
-                if d.month == 2 and d.day == 29:
-                    raise ValueError(f"{calendar} must not have 29 Feb: found {d}")
+            bad = (months == 2) & (days == 29)
+            if bad.any():
+                raise ValueError(
+                    f"{calendar} must not have 29 Feb: found {dates[bad.argmax()]}"
+                )
         elif calendar == "360_day":
-            for d in dates:
-                if d.day > 30:
-                    raise ValueError(f"360_day calendar has day > 30: {d}")
+            bad = days > 30
+            if bad.any():
+                raise ValueError(
+                    f"360_day calendar has day > 30: {dates[bad.argmax()]}"
+                )
 
     def _check_range(self, var: str, vmin: float, vmax: float):
         arr = self.ds[var]
         if hasattr(arr.data, "map_blocks"):
-            too_small = (arr < vmin).any().compute()
-            too_large = (arr > vmax).any().compute()
+            # Compute both reductions together so each chunk is read only once
+            amin, amax = dask.compute(arr.min(), arr.max())
         else:
-            too_small = (arr < vmin).any().item()
-            too_large = (arr > vmax).any().item()
-        if too_small:
+            amin, amax = arr.min(), arr.max()
+        if amin.item() < vmin:
             raise ValueError(f"Values of '{var}' below valid_min: {vmin}")
-        if too_large:
+        if amax.item() > vmax:
             raise ValueError(f"Values of '{var}' above valid_max: {vmax}")
 
     def drop_intermediates(self):
-        for var in self.mapping[self.cmor_name]["model_variables"]:
-            if var in self.ds.data_vars and var != self.cmor_name:
-                self.ds = self.ds.drop_vars(var)
+        to_drop = [
+            var
+            for var in self.mapping[self.cmor_name]["model_variables"]
+            if var in self.ds.data_vars and var != self.cmor_name
+        ]
+        if to_drop:
+            self.ds = self.ds.drop_vars(to_drop)
 
     def update_attributes(self):
         raise NotImplementedError("Subclasses must implement update_attributes.")
 
     def reorder(self):
         def ordered(ds, core=("lat", "lon", "time", "height")):
-            seen = set()
-            order = []
-            for name in core:
-                if name in ds.variables:
-                    order.append(name)
-                    seen.add(name)
-                bnds = f"{name}_bnds"
-                if bnds in ds.variables:
-                    order.append(bnds)
-                    seen.add(bnds)
-            for v in ds.variables:
-                if v not in seen:
-                    order.append(v)
+            order = [
+                v for name in core for v in (name, f"{name}_bnds") if v in ds.variables
+            ]
+            seen = set(order)
+            order += [v for v in ds.variables if v not in seen]
+            if order == list(ds.variables):
+                return ds  # Already ordered: avoid rebuilding the dataset
             return ds[order]
 
         self.ds = ordered(self.ds)
 
     def _build_drs_path(self, attrs: Dict[str, str]) -> Path:
-        drs_components = [
+        return self.drs_root.joinpath(
             attrs.get("mip_era", "CMIP6"),
-            attrs["activity_id"],
-            attrs["institution_id"],
-            attrs["source_id"],
-            attrs["experiment_id"],
-            attrs["variant_label"],
-            attrs["table_id"],
-            attrs["variable_id"],
-            attrs["grid_label"],
+            *(attrs[k] for k in self._DRS_KEYS),
             f"v{self.version_date}",
-        ]
-        return self.drs_root.joinpath(*drs_components)
+        )
 
     def _update_latest_symlink(self, versioned_path: Path):
         latest_link = versioned_path.parent / "latest"
@@ -259,7 +361,72 @@ class CMIP6_CMORiser:
         except Exception as e:
             print(f"Warning: Failed to update latest symlink at {latest_link}: {e}")
 
-    def write(self):
+    @staticmethod
+    def _time_block_size(vdat: xr.DataArray, ncvar, target_bytes: float) -> int:
+        """
+        Number of time steps to write per block so that each block is ~target_bytes,
+        rounded down to a multiple of the on-disk time chunk when possible.
+        """
+        n_time = vdat.sizes["time"]
+        bytes_per_tstep = max(vdat.nbytes // max(n_time, 1), 1)
+        block = max(1, min(n_time, int(target_bytes // bytes_per_tstep)))
+        chunking = ncvar.chunking()
+        if chunking != "contiguous":
+            time_chunk = chunking[vdat.dims.index("time")]
+            if block > time_chunk:
+                block -= block % time_chunk
+        return block
+
+    def _chunksizes(self, vdat: xr.DataArray) -> Optional[List[int]]:
+        """
+        On-disk chunk shape for vdat: the source chunking when it still matches
+        the variable, otherwise time-major tiles of ~chunk_target_bytes.
+        """
+        chunks = vdat.encoding.get("chunksizes")
+        if chunks and len(chunks) == vdat.ndim:
+            if not self.unlimited_time:
+                # A fixed-size time dimension cannot hold a longer chunk, e.g. the
+                # [512] netCDF-C gives 1-D variables along an unlimited time
+                chunks = [
+                    min(c, size) if dim == "time" else c
+                    for c, dim, size in zip(chunks, vdat.dims, vdat.shape)
+                ]
+            if all(
+                0 < c <= size or dim == "time"
+                for c, dim, size in zip(chunks, vdat.dims, vdat.shape)
+            ):
+                return list(chunks)
+        if "time" not in vdat.dims:
+            return None  # Let the library choose for time-invariant variables
+        n_time = vdat.sizes["time"]
+        bytes_per_tstep = max(vdat.nbytes // max(n_time, 1), 1)
+        tile = max(1, min(n_time, int(self.chunk_target_bytes // bytes_per_tstep)))
+        return [tile if dim == "time" else size for dim, size in vdat.sizes.items()]
+
+    def _write_time_blocks(self, vdat: xr.DataArray, ncvar):
+        """
+        Write vdat to ncvar in time blocks to bound memory use for large variables.
+
+        Blocks are read and written in turn on the calling thread: netCDF-C is
+        not thread-safe, so reading the next block while writing this one would
+        run two library calls at once.
+        """
+        time_axis = vdat.dims.index("time")
+        n_time = vdat.sizes["time"]
+        block = self._time_block_size(vdat, ncvar, self.write_block_bytes)
+
+        # Only the time entry of the output index changes between blocks
+        index = [slice(None)] * vdat.ndim
+        for t0 in range(0, n_time, block):
+            tslice = slice(t0, min(t0 + block, n_time))
+            index[time_axis] = tslice
+            ncvar[tuple(index)] = vdat.isel(time=tslice).values
+
+    def _output_file(self, suffix: str = ".nc") -> Path:
+        """
+        Build the CMIP6 output file path (DRS tree or output_path) for the
+        current dataset, creating the parent directory if needed.
+        """
         attrs = self.ds.attrs
         required_keys = [
             "variable_id",
@@ -275,17 +442,23 @@ class CMIP6_CMORiser:
                 f"Missing required CMIP6 global attributes for filename: {missing}"
             )
 
-        time_var = self.ds[self.cmor_name].coords["time"]
-        units = time_var.attrs["units"]
-        calendar = time_var.attrs.get("calendar", "standard").lower()
-        times = num2date(time_var.values[[0, -1]], units=units, calendar=calendar)
-        start, end = [f"{t.year:04d}{t.month:02d}" for t in times]
+        time_index = self.ds.indexes["time"]
+        times = [time_index[0], time_index[-1]]
+        if not hasattr(times[0], "year"):
+            # Time is still numeric (decode_cf=False): only decode the endpoints
+            time_attrs = self.ds["time"].attrs
+            times = num2date(
+                times,
+                units=time_attrs["units"],
+                calendar=time_attrs.get("calendar", "standard").lower(),
+            )
+        start, end = [t.strftime("%Y%m") for t in times]
         time_range = f"{start}-{end}"
 
         filename = (
             f"{attrs['variable_id']}_{attrs['table_id']}_{attrs['source_id']}_"
             f"{attrs['experiment_id']}_{attrs['variant_label']}_"
-            f"{attrs['grid_label']}_{time_range}.nc"
+            f"{attrs['grid_label']}_{time_range}{suffix}"
         )
 
         if self.drs_root:
@@ -296,35 +469,105 @@ class CMIP6_CMORiser:
         else:
             path = Path(self.output_path) / filename
             path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def write(self, in_memory: bool = False):
+        """
+        Write the CMORised dataset to a CMIP6-named NetCDF file.
+
+        Args:
+            in_memory: Build the file in memory and write it to disk once when it
+                is closed (netCDF4 diskless mode). This needs memory for the whole
+                file, so it only applies when the dataset is smaller than
+                in_memory_max_bytes; larger datasets are written directly.
+        """
+        attrs = self.ds.attrs
+        path = self._output_file()
+        diskless = in_memory and self.ds.nbytes < self.in_memory_max_bytes
+
+        # Small outputs fit in a single block: skip per-variable block planning
+        cmor_var = self.ds[self.cmor_name]
+        small = cmor_var.size * cmor_var.dtype.itemsize < self.write_block_bytes
+
+        # Load coordinates and bounds with a single dask.compute so their reads
+        # run concurrently; the netCDF4 writes below are not thread-safe.
+        aux_vars = [var for var in self.ds.variables if var != self.cmor_name]
+        aux_values = dict(
+            zip(aux_vars, dask.compute(*(self.ds[var].data for var in aux_vars)))
+        )
 
-        with nc.Dataset(path, "w", format="NETCDF4") as dst:
-            for k, v in attrs.items():
-                dst.setncattr(k, v)
+        with nc.Dataset(
+            path, "w", format="NETCDF4", diskless=diskless, persist=diskless
+        ) as dst:
+            # Every element is written below, so skip prefilling with fill values
+            dst.set_fill_off()
+            dst.setncatts(attrs)
             for dim, size in self.ds.sizes.items():
-                if dim == "time":
+                if dim == "time" and self.unlimited_time:
                     dst.createDimension(dim, None)  # Unlimited dimension
                 else:
                     dst.createDimension(dim, size)
             for var in self.ds.variables:
                 vdat = self.ds[var]
                 fill = None if var.endswith("_bnds") else vdat.attrs.get("_FillValue")
-                v = (
-                    dst.createVariable(var, str(vdat.dtype), vdat.dims, fill_value=fill)
-                    if fill
-                    else dst.createVariable(var, str(vdat.dtype), vdat.dims)
+                kwargs = {"fill_value": fill} if fill else {}
+                if vdat.ndim:
+                    if self.compression:
+                        kwargs.update(
+                            compression=self.compression,
+                            complevel=self.complevel,
+                            shuffle=True,
+                        )
+                    chunks = self._chunksizes(vdat)
+                    if chunks:
+                        kwargs["chunksizes"] = chunks
+                v = dst.createVariable(var, str(vdat.dtype), vdat.dims, **kwargs)
+                # Data are written as stored (decode_cf=False): skip the masked-array
+                # conversion and do not re-apply scale_factor/add_offset on write
+                v.set_auto_maskandscale(False)
+                v.setncatts(
+                    {a: val for a, val in vdat.attrs.items() if a != "_FillValue"}
                 )
-                if not var.endswith("_bnds"):
-                    for a, val in vdat.attrs.items():
-                        if a != "_FillValue":
-                            v.setncattr(a, val)
-                v[:] = vdat.values
+                if var in aux_values:
+                    v[:] = aux_values[var]
+                elif "time" in vdat.dims and not small:
+                    self._write_time_blocks(vdat, v)
+                else:
+                    v[:] = vdat.values
 
         print(f"CMORised output written to {path}")
 
-    def run(self, write_output: bool = False):
+    def write_zarr(self):
+        """
+        Write the CMORised dataset to a Zarr store named like the NetCDF output.
+
+        Zarr stores are working copies for chunk-parallel analysis; write() remains
+        the CMIP6-compliant output. Requires zarr to be installed.
+        """
+        try:
+            import zarr  # noqa: F401
+        except ImportError:
+            raise ImportError("zarr is required for write_zarr(). Please install zarr.")
+
+        path = self._output_file(".zarr")
+        ds = self.ds.copy()
+        encoding = {}
+        for var in ds.data_vars:
+            chunks = self._chunksizes(ds[var])
+            if chunks:
+                # Zarr needs dask chunks that line up with the store chunks
+                ds[var] = ds[var].chunk(dict(zip(ds[var].dims, chunks)))
+                encoding[var] = {"chunks": chunks}
+        ds.to_zarr(path, mode="w", encoding=encoding)
+
+        print(f"CMORised Zarr output written to {path}")
+
+    def run(self, write_output: Union[bool, str] = False):
         self.select_and_process_variables()
         self.drop_intermediates()
         self.update_attributes()
         self.reorder()
-        if write_output:
+        if write_output == "zarr":
+            self.write_zarr()
+        elif write_output:
             self.write()
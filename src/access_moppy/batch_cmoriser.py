@@ -252,8 +252,7 @@ def main():
 
     # Pre-populate all tasks
     experiment_id = config_data["experiment_id"]
-    for variable in config_data["variables"]:
-        tracker.add_task(variable, experiment_id)
+    tracker.add_tasks(config_data["variables"], experiment_id)
 
     print(
         f"Database initialized with {len(config_data['variables'])} tasks at: {db_path}"
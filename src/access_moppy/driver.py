@@ -31,6 +31,9 @@ class ACCESS_ESM_CMORiser:
         validate_frequency: bool = True,
         enable_resampling: bool = False,
         resampling_method: str = "auto",
+        compression: Optional[str] = "zlib",
+        complevel: int = 1,
+        unlimited_time: bool = True,
     ):
         """
         Initializes the CMORiser with necessary parameters.
@@ -48,12 +51,18 @@ class ACCESS_ESM_CMORiser:
         :param validate_frequency: Whether to validate temporal frequency consistency across input files (default: True).
         :param enable_resampling: Whether to enable automatic temporal resampling when frequency mismatches occur (default: False).
         :param resampling_method: Method for temporal resampling ('auto', 'mean', 'sum', 'min', 'max', 'first', 'last') (default: 'auto').
+        :param compression: NetCDF compression filter for the output ('zlib', or 'zstd' with netCDF-C >= 4.9), or None for no compression (default: 'zlib').
+        :param complevel: Compression level for the output (default: 1).
+        :param unlimited_time: Whether to write time as an unlimited dimension; set to False for a fixed-size time dimension (default: True).
         """
 
         self.input_paths = input_paths
         self.validate_frequency = validate_frequency
         self.enable_resampling = enable_resampling
         self.resampling_method = resampling_method
+        self.compression = compression
+        self.complevel = complevel
+        self.unlimited_time = unlimited_time
         self.output_path = Path(output_path)
         self.compound_name = compound_name
         self.experiment_id = experiment_id
@@ -104,6 +113,9 @@ class ACCESS_ESM_CMORiser:
                 validate_frequency=self.validate_frequency,
                 enable_resampling=self.enable_resampling,
                 resampling_method=self.resampling_method,
+                compression=self.compression,
+                complevel=self.complevel,
+                unlimited_time=self.unlimited_time,
             )
         elif table in ("Oyr", "Oday", "Omon", "SImon"):
             self.cmoriser = CMIP6_Ocean_CMORiser(
@@ -116,6 +128,9 @@ class ACCESS_ESM_CMORiser:
                 validate_frequency=self.validate_frequency,
                 enable_resampling=self.enable_resampling,
                 resampling_method=self.resampling_method,
+                compression=self.compression,
+                complevel=self.complevel,
+                unlimited_time=self.unlimited_time,
             )
 
     def __getitem__(self, key):
@@ -151,17 +166,28 @@ class ACCESS_ESM_CMORiser:
                 "ncdata and iris are required for to_iris(). Please install ncdata and iris."
             )
 
-    def run(self, write_output: bool = False):
+    def run(self, write_output: Union[bool, str] = False):
         """
         Runs the CMORisation process, including variable selection, processing,
-        attribute updates, and optional output writing."""
+        attribute updates, and optional output writing (write_output="zarr"
+        writes a Zarr store instead of NetCDF)."""
 
         self.cmoriser.run()
-        if write_output:
+        if write_output == "zarr":
+            self.cmoriser.write_zarr()
+        elif write_output:
             self.cmoriser.write()
 
-    def write(self):
+    def write(self, in_memory: bool = False):
         """
         Writes the CMORised dataset to the specified output path.
+        :param in_memory: Build small output files in memory and flush them to disk once.
         """
-        self.cmoriser.write()
+        self.cmoriser.write(in_memory=in_memory)
+
+    def write_zarr(self):
+        """
+        Writes the CMORised dataset to a Zarr store in the output path.
+        Requires zarr to be installed.
+        """
+        self.cmoriser.write_zarr()
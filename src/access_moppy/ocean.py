@@ -1,8 +1,6 @@
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
-import numpy as np
-
 from access_moppy.base import CMIP6_CMORiser
 from access_moppy.derivations import custom_functions, evaluate_expression
 from access_moppy.ocean_supergrid import Supergrid
@@ -25,6 +23,9 @@ class CMIP6_Ocean_CMORiser(CMIP6_CMORiser):
         validate_frequency: bool = True,
         enable_resampling: bool = False,
         resampling_method: str = "auto",
+        compression: Optional[str] = "zlib",
+        complevel: int = 1,
+        unlimited_time: bool = True,
     ):
         super().__init__(
             input_paths=input_paths,
@@ -36,6 +37,9 @@ class CMIP6_Ocean_CMORiser(CMIP6_CMORiser):
             validate_frequency=validate_frequency,
             enable_resampling=enable_resampling,
             resampling_method=resampling_method,
+            compression=compression,
+            complevel=complevel,
+            unlimited_time=unlimited_time,
         )
 
         nominal_resolution = cmip6_vocab._get_nominal_resolution()
@@ -43,15 +47,17 @@ class CMIP6_Ocean_CMORiser(CMIP6_CMORiser):
         self.grid_info = None
         self.grid_type = None
 
+    # Grid -> coordinates that identify it; grids are tried in this order
+    _GRID_COORDS = {
+        "T": frozenset({"xt_ocean", "yt_ocean"}),
+        "U": frozenset({"xu_ocean", "yu_ocean"}),
+        "V": frozenset({"xv_ocean", "yv_ocean"}),
+        "Q": frozenset({"xq_ocean", "yq_ocean"}),
+    }
+
     def infer_grid_type(self):
-        coord_sets = {
-            "T": {"xt_ocean", "yt_ocean"},
-            "U": {"xu_ocean", "yu_ocean"},
-            "V": {"xv_ocean", "yv_ocean"},
-            "Q": {"xq_ocean", "yq_ocean"},
-        }
         present_coords = set(self.ds.coords)
-        for grid, required in coord_sets.items():
+        for grid, required in self._GRID_COORDS.items():
             if required.issubset(present_coords):
                 return grid
         raise ValueError("Could not infer grid type from dataset coordinates.")
@@ -87,23 +93,25 @@ class CMIP6_Ocean_CMORiser(CMIP6_CMORiser):
             k: v for k, v in dim_rename.items() if k in self.ds[self.cmor_name].dims
         }
         self.ds[self.cmor_name] = self.ds[self.cmor_name].rename(dims_to_rename)
-        self.ds[self.cmor_name] = self.ds[self.cmor_name].transpose("time", "j", "i")
+        if self.ds[self.cmor_name].dims != ("time", "j", "i"):
+            self.ds[self.cmor_name] = self.ds[self.cmor_name].transpose(
+                "time", "j", "i"
+            )
 
         self.grid_type = self.infer_grid_type()
         # Drop all other data variables except the CMOR variable
         self.ds = self.ds[[self.cmor_name]]
 
         # Drop unused coordinates
-        used_coords = set()
-        for dim in self.ds[self.cmor_name].dims:
-            if dim in self.ds.coords:
-                used_coords.add(dim)
-            else:
-                # Might be implicit dimension (e.g. from formula), check all coords
-                for coord in self.ds.coords:
-                    if dim in self.ds[coord].dims:
-                        used_coords.add(coord)
-        self.ds = self.ds.drop_vars([c for c in self.ds.coords if c not in used_coords])
+        coords = set(self.ds.coords)
+        cmor_dims = set(self.ds[self.cmor_name].dims)
+        # Dimensions without a coordinate might be implicit (e.g. from formula):
+        # keep any coordinate that spans them
+        implicit_dims = cmor_dims - coords
+        used_coords = (cmor_dims & coords) | {
+            c for c in coords if implicit_dims.intersection(self.ds.variables[c].dims)
+        }
+        self.ds = self.ds.drop_vars([c for c in coords if c not in used_coords])
 
     def update_attributes(self):
         grid_type = self.grid_type
@@ -160,9 +168,9 @@ class CMIP6_Ocean_CMORiser(CMIP6_CMORiser):
             {k: v for k, v in cmor_attrs.items() if v not in (None, "")}
         )
         var_type = cmor_attrs.get("type", "double")
-        self.ds[self.cmor_name] = self.ds[self.cmor_name].astype(
-            self.type_mapping.get(var_type, np.float64)
-        )
+        target_dtype = self.type_mapping.get(var_type, self.type_mapping["double"])
+        if self.ds[self.cmor_name].dtype != target_dtype:
+            self.ds[self.cmor_name] = self.ds[self.cmor_name].astype(target_dtype)
 
         # Check calendar and units
         self._check_calendar("time")
@@ -1,11 +1,150 @@
+import functools
 import os
-import tempfile
+import shutil
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import numpy as np
 import requests
 import xarray as xr
 from tqdm import tqdm
 
+# Nominal resolution -> (supergrid file name, Google Drive file ID)
+_RES_TABLE = {
+    "100 km": ("mom1deg.nc", "1Ito5EspxaICiTD1cfzcpcWTGNYg29fQf"),
+    "25 km": ("mom025deg.nc", "1aNO1Y7HeU4YHjPi1Wsw_xRbp-SQG3NoA"),
+    "10 km": ("mom01deg.nc", "GOOGLE_DRIVE_FILE_ID_FOR_10KM"),
+}
+
+GADI_GRID_DIR = Path("/g/data/xp65/public/apps/access_moppy_data/grids")
+# Downloaded supergrids are kept here so they survive across sessions and reboots
+GRID_CACHE_DIR = Path.home() / ".moppy" / "grids"
+
+
+def _is_complete(path: Path) -> bool:
+    """Whether path is a non-empty regular file, using a single stat call."""
+    try:
+        st = path.stat()
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and st.st_size > 0
+
+
+@functools.lru_cache(maxsize=4)
+def _open_supergrid(path: str, mtime_ns: int) -> xr.Dataset:
+    """Open a supergrid file once per (path, modification time)."""
+    # A static grid file: no masking, scaling or time decoding to apply
+    supergrid = xr.open_dataset(path, decode_cf=False)
+    return supergrid.rename(
+        {"nxp": "i_full", "nyp": "j_full", "x": "x_full", "y": "y_full"}
+    )
+
+
+def _stream_to_file(response: requests.Response, dest_path: str, desc: str):
+    """Copy a streamed response body to dest_path in 1 MiB reads."""
+    total = int(response.headers.get("content-length", 0))
+    response.raw.decode_content = True
+    with (
+        open(dest_path, "wb") as f,
+        tqdm.wrapattr(
+            response.raw, "read", total=total, unit="B", unit_scale=True, desc=desc
+        ) as raw,
+    ):
+        shutil.copyfileobj(raw, f, length=1 << 20)
+        # Content-Length counts encoded bytes, so only check identity transfers
+        if total and "content-encoding" not in response.headers and f.tell() != total:
+            raise RuntimeError(f"Incomplete download: {f.tell()} of {total} bytes")
+
+
+def _download(url: str, dest_path: str, workers: int = 4):
+    """
+    Download url to dest_path in byte ranges fetched concurrently, or as a
+    single stream if the server does not honour range requests.
+    """
+    desc = f"Downloading {os.path.basename(dest_path)}"
+    # Uncompressed transfer so byte ranges map directly onto the file
+    headers = {"Accept-Encoding": "identity"}
+
+    # Ask for the first byte: a 206 reply carries the total size, while a server
+    # without range support sends the whole file, which is streamed as is
+    with requests.get(url, stream=True, headers={**headers, "Range": "bytes=0-0"}) as r:
+        r.raise_for_status()
+        if r.status_code != 206:
+            _stream_to_file(r, dest_path, desc)
+            return
+        size = r.headers.get("content-range", "").rpartition("/")[2]
+    if not size.isdigit():
+        # Total size unknown: fall back to a single stream
+        with requests.get(url, stream=True, headers=headers) as r:
+            r.raise_for_status()
+            _stream_to_file(r, dest_path, desc)
+        return
+    total = int(size)
+
+    part = -(-total // workers)
+    lock = threading.Lock()
+
+    def fetch(start: int, end: int):
+        range_headers = {**headers, "Range": f"bytes={start}-{end}"}
+        with (
+            requests.get(url, stream=True, headers=range_headers) as r,
+            open(dest_path, "r+b") as f,
+        ):
+            r.raise_for_status()
+            if r.status_code != 206:
+                raise RuntimeError(f"Server ignored byte range {start}-{end}")
+            f.seek(start)
+            for chunk in r.iter_content(1 << 20):
+                f.write(chunk)
+                with lock:
+                    pbar.update(len(chunk))
+            if f.tell() != end + 1:
+                raise RuntimeError(f"Incomplete download of byte range {start}-{end}")
+
+    with open(dest_path, "wb") as f:
+        f.truncate(total)
+    try:
+        with (
+            tqdm(total=total, unit="B", unit_scale=True, desc=desc) as pbar,
+            ThreadPoolExecutor(max_workers=workers) as pool,
+        ):
+            futures = [
+                pool.submit(fetch, start, min(start + part, total) - 1)
+                for start in range(0, total, part)
+            ]
+            for future in futures:
+                future.result()
+    except BaseException:
+        # Don't leave a full-size file with missing ranges behind
+        os.remove(dest_path)
+        raise
+
+
+def _lattice(name: str, row: int, col: int) -> functools.cached_property:
+    """
+    Cached property holding every second point of supergrid variable name,
+    starting from (row, col).
+    """
+    return functools.cached_property(
+        lambda self: self.supergrid[name][row::2, col::2].values
+    )
+
+
+def _wrap_longitude(lon: np.ndarray) -> np.ndarray:
+    """Return a copy of lon wrapped to [0, 360), reusing a single buffer."""
+    wrapped = np.add(lon, 360)
+    return np.mod(wrapped, 360, out=wrapped)
+
+
+def _cell_vertices(corners: np.ndarray) -> np.ndarray:
+    """Stack the four corners of each cell, counterclockwise from the lower left."""
+    return np.stack(
+        [corners[:-1, :-1], corners[:-1, 1:], corners[1:, 1:], corners[1:, :-1]],
+        axis=-1,
+    )
+
 
 class Supergrid:
     def __init__(self, nominal_resolution: str):
@@ -21,102 +160,104 @@ class Supergrid:
         """
         if not self.nominal_resolution:
             raise ValueError("nominal_resolution must be provided")
-        # Mapping nominal resolution to file names
-        supergrid_filenames = {
-            "100 km": "mom1deg.nc",
-            "25 km": "mom025deg.nc",
-            "10 km": "mom01deg.nc",
-        }
-
-        if nominal_resolution not in supergrid_filenames:
+        try:
+            supergrid_filename, file_id = _RES_TABLE[nominal_resolution]
+        except KeyError:
             raise ValueError(
                 f"Unknown or unsupported nominal resolution: {nominal_resolution}"
-            )
-
-        supergrid_filename = supergrid_filenames[nominal_resolution]
-        gadi_supergrid_dir = "/g/data/xp65/public/apps/access_moppy_data/grids"
-        gadi_supergrid_path = os.path.join(gadi_supergrid_dir, supergrid_filename)
+            ) from None
 
         # Check if running on Gadi and file exists
-        if os.path.exists(gadi_supergrid_path):
-            supergrid_path = gadi_supergrid_path
-        else:
-            # Not on Gadi or file not available, download from Google Drive
-            # Mapping nominal resolution to Google Drive file IDs
-            gdrive_file_ids = {
-                "100 km": "1Ito5EspxaICiTD1cfzcpcWTGNYg29fQf",
-                "25 km": "1aNO1Y7HeU4YHjPi1Wsw_xRbp-SQG3NoA",
-                "10 km": "GOOGLE_DRIVE_FILE_ID_FOR_10KM",
-            }
-            file_id = gdrive_file_ids[nominal_resolution]
-            tmp_dir = tempfile.gettempdir()
-            supergrid_path = os.path.join(tmp_dir, supergrid_filename)
-            if not os.path.exists(supergrid_path):
-                try:
-
-                    def download_from_gdrive(file_id, dest_path):
-                        # Download files from Google Drive (no token handling)
-                        URL = (
-                            f"https://drive.google.com/uc?export=download&id={file_id}"
-                        )
-                        with requests.get(URL, stream=True) as response:
-                            response.raise_for_status()
-                            total = int(response.headers.get("content-length", 0))
-                            with (
-                                open(dest_path, "wb") as f,
-                                tqdm(
-                                    total=total,
-                                    unit="B",
-                                    unit_scale=True,
-                                    desc=f"Downloading {os.path.basename(dest_path)}",
-                                ) as pbar,
-                            ):
-                                for chunk in response.iter_content(32768):
-                                    if chunk:
-                                        f.write(chunk)
-                                        pbar.update(len(chunk))
-
-                    download_from_gdrive(file_id, supergrid_path)
-                except Exception as e:
-                    raise RuntimeError(
-                        f"Could not download supergrid file for {nominal_resolution}: {e}"
-                    )
-        return supergrid_path
+        gadi_supergrid_path = GADI_GRID_DIR / supergrid_filename
+        if _is_complete(gadi_supergrid_path):
+            return str(gadi_supergrid_path)
+
+        # Not on Gadi or file not available, download from Google Drive
+        supergrid_path = GRID_CACHE_DIR / supergrid_filename
+        if not _is_complete(supergrid_path):
+            supergrid_path.parent.mkdir(parents=True, exist_ok=True)
+            # Download next to the target and move it into place when complete,
+            # so an interrupted download is never picked up as a valid grid
+            partial_path = supergrid_path.with_name(supergrid_path.name + ".part")
+            try:
+
+                def download_from_gdrive(file_id, dest_path):
+                    # Download files from Google Drive (no token handling)
+                    URL = f"https://drive.google.com/uc?export=download&id={file_id}"
+                    _download(URL, dest_path)
+
+                download_from_gdrive(file_id, str(partial_path))
+                partial_path.replace(supergrid_path)
+            except Exception as e:
+                raise RuntimeError(
+                    f"Could not download supergrid file for {nominal_resolution}: {e}"
+                )
+        return str(supergrid_path)
 
     def load_supergrid(self, supergrid_file: str):
         """Load the supergrid dataset from the specified file."""
         if not supergrid_file:
             raise ValueError("supergrid_file must be provided")
 
-        self.supergrid = xr.open_dataset(supergrid_file).rename_dims(
-            {"nxp": "i_full", "nyp": "j_full"}
+        self._grid_cache = {}
+        # Drop arrays computed from a previously loaded supergrid
+        for name in self._LATTICES:
+            self.__dict__.pop(name, None)
+        self.supergrid = _open_supergrid(
+            supergrid_file, os.stat(supergrid_file).st_mtime_ns
         )
-        self.supergrid = self.supergrid.rename_vars({"x": "x_full", "y": "y_full"})
-        self.xt = self.supergrid["x_full"][1::2, 1::2]
-        self.yt = self.supergrid["y_full"][1::2, 1::2]
-        self.xu = self.supergrid["x_full"][1::2, ::2]
-        self.yu = self.supergrid["y_full"][1::2, ::2]
-        self.xv = self.supergrid["x_full"][::2, 1::2]
-        self.yv = self.supergrid["y_full"][::2, 1::2]
-        self.xq = self.supergrid["x_full"][::2, ::2]
-        self.yq = self.supergrid["y_full"][::2, ::2]
+
+    # The supergrid is only read when a grid is first requested. The staggered
+    # grids are strided reads, so e.g. the T grid only reads half of the file;
+    # once the full supergrid has been loaded they are sliced from memory
+    _LATTICES = ("x_full", "y_full", "xt", "yt", "xu", "yu", "xv", "yv", "xq", "yq")
+
+    @functools.cached_property
+    def x_full(self):
+        return self.supergrid["x_full"].values
+
+    @functools.cached_property
+    def y_full(self):
+        return self.supergrid["y_full"].values
+
+    xt = _lattice("x_full", 1, 1)
+    yt = _lattice("y_full", 1, 1)
+    xu = _lattice("x_full", 1, 0)
+    yu = _lattice("y_full", 1, 0)
+    xv = _lattice("x_full", 0, 1)
+    yv = _lattice("y_full", 0, 1)
+    xq = _lattice("x_full", 0, 0)
+    yq = _lattice("y_full", 0, 0)
 
     def extract_grid(self, grid_type: str):
+        """Return the CMOR grid coordinates for grid_type, built once per instance."""
+        if grid_type not in self._grid_cache:
+            grid = self._build_grid(grid_type)
+            # Cached arrays are shared between callers, so make them read-only
+            for da in grid.values():
+                da.values.setflags(write=False)
+            self._grid_cache[grid_type] = grid
+        # Shallow copies share the data but not the attributes
+        return {k: v.copy(deep=False) for k, v in self._grid_cache[grid_type].items()}
+
+    def _build_grid(self, grid_type: str):
         if grid_type == "T":
             x = self.xt
             y = self.yt
             corners_x = self.xq
             corners_y = self.yq
         elif grid_type == "U":
+            # Load the full supergrid first so xu/yu are sliced from memory
+            corners_x = self.x_full
+            corners_y = self.y_full
             x = self.xu
             y = self.yu
-            corners_x = self.supergrid["x_full"]
-            corners_y = self.supergrid["y_full"]
         elif grid_type == "V":
+            # Load the full supergrid first so xv/yv are sliced from memory
+            corners_x = self.x_full
+            corners_y = self.y_full
             x = self.xv
             y = self.yv
-            corners_x = self.supergrid["x_full"]
-            corners_y = self.supergrid["y_full"]
         elif grid_type == "Q":
             x = self.xq
             y = self.yq
@@ -125,7 +266,7 @@ class Supergrid:
         else:
             raise ValueError(f"Unsupported grid_type: {grid_type}")
 
-        corners_x = (corners_x + 360) % 360
+        corners_x = _wrap_longitude(corners_x)
 
         i_coord = xr.DataArray(
             np.arange(x.shape[1]),
@@ -142,36 +283,19 @@ class Supergrid:
         vertices = xr.DataArray(np.arange(4), dims="vertices", name="vertices")
 
         lat = xr.DataArray(y, dims=("j", "i"), name="latitude")
-        lon = xr.DataArray((x + 360) % 360, dims=("j", "i"), name="longitude")
-
-        lat_bnds = (
-            xr.concat(
-                [
-                    corners_y[:-1, :-1].expand_dims(vertices=[0]),
-                    corners_y[:-1, 1:].expand_dims(vertices=[1]),
-                    corners_y[1:, 1:].expand_dims(vertices=[2]),
-                    corners_y[1:, :-1].expand_dims(vertices=[3]),
-                ],
-                dim="vertices",
-            )
-            .rename({"j_full": "j", "i_full": "i"})
-            .transpose("j", "i", "vertices")
-            .rename("vertices_latitude")
-        )
+        lon = xr.DataArray(_wrap_longitude(x), dims=("j", "i"), name="longitude")
 
-        lon_bnds = (
-            xr.concat(
-                [
-                    corners_x[:-1, :-1].expand_dims(vertices=[0]),
-                    corners_x[:-1, 1:].expand_dims(vertices=[1]),
-                    corners_x[1:, 1:].expand_dims(vertices=[2]),
-                    corners_x[1:, :-1].expand_dims(vertices=[3]),
-                ],
-                dim="vertices",
-            )
-            .rename({"j_full": "j", "i_full": "i"})
-            .transpose("j", "i", "vertices")
-            .rename("vertices_longitude")
+        lat_bnds = xr.DataArray(
+            _cell_vertices(corners_y),
+            dims=("j", "i", "vertices"),
+            coords={"vertices": vertices.values},
+            name="vertices_latitude",
+        )
+        lon_bnds = xr.DataArray(
+            _cell_vertices(corners_x),
+            dims=("j", "i", "vertices"),
+            coords={"vertices": vertices.values},
+            name="vertices_longitude",
         )
 
         return {
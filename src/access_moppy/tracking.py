@@ -4,6 +4,9 @@ import time
 from pathlib import Path
 from typing import Optional
 
+# Identical SQL text lets sqlite3 reuse its cached prepared statement
+_SELECT_STATUS = "SELECT status FROM cmor_tasks WHERE variable=? AND experiment_id=?"
+
 
 class TaskTracker:
     def __init__(self, db_path: Optional[Path] = None):
@@ -18,6 +21,7 @@ class TaskTracker:
         # Enable WAL mode for better concurrent access
         self.conn.execute("PRAGMA journal_mode=WAL")
         self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
         with self.conn:
             self.conn.execute(
                 """
@@ -46,6 +50,17 @@ class TaskTracker:
                 (variable, experiment_id),
             )
 
+    def add_tasks(self, variables, experiment_id: str):
+        """Add a task per variable in a single transaction."""
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT OR IGNORE INTO cmor_tasks (variable, experiment_id)
+                VALUES (?, ?)
+                """,
+                ((variable, experiment_id) for variable in variables),
+            )
+
     def mark_running(self, variable: str, experiment_id: str):
         with self.conn:
             self.conn.execute(
@@ -85,26 +100,11 @@ class TaskTracker:
 
     def get_status(self, variable: str, experiment_id: str) -> Optional[str]:
         """Get the status of a task."""
-        cur = self.conn.cursor()
-        cur.execute(
-            """
-            SELECT status FROM cmor_tasks WHERE variable=? AND experiment_id=?
-            """,
-            (variable, experiment_id),
-        )
-        row = cur.fetchone()
+        row = self.conn.execute(_SELECT_STATUS, (variable, experiment_id)).fetchone()
         return row[0] if row is not None else None
 
     def is_done(self, variable: str, experiment_id: str) -> bool:
-        cur = self.conn.cursor()
-        cur.execute(
-            """
-            SELECT status FROM cmor_tasks WHERE variable=? AND experiment_id=?
-            """,
-            (variable, experiment_id),
-        )
-        row = cur.fetchone()
-        return row is not None and row[0] == "completed"
+        return self.get_status(variable, experiment_id) == "completed"
 
     def _execute_with_retry(self, query, params=(), max_retries=5):
         for attempt in range(max_retries):
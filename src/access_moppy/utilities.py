@@ -1,23 +1,62 @@
+import copy
+import functools
 import json
+import os
+import re
 import warnings
-from importlib.resources import as_file, files
+from datetime import datetime
+from importlib.resources import files
 from typing import Dict, List, Optional, Union
 
+import netCDF4 as nc
 import numpy as np
 import pandas as pd
 import xarray as xr
 from cftime import num2date
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
 type_mapping = {
-    "real": np.float32,
-    "double": np.float64,
-    "float": np.float32,
-    "int": np.int32,
-    "short": np.int16,
-    "byte": np.int8,
+    "real": np.dtype(np.float32),
+    "double": np.dtype(np.float64),
+    "float": np.dtype(np.float32),
+    "int": np.dtype(np.int32),
+    "short": np.dtype(np.int16),
+    "byte": np.dtype(np.int8),
 }
 
 
+# Mapping sections searched for a CMOR name, in order of precedence. The flat
+# "variables" section is only kept for backward compatibility and comes last.
+_MAPPING_COMPONENTS = ("atmosphere", "land", "ocean", "time_invariant", "variables")
+
+
+@functools.lru_cache(maxsize=8)
+def _load_mapping_index(model_id: str) -> Dict:
+    """
+    Parse the consolidated mapping file for a model once and index its entries
+    by CMOR name. Returns {} if the model has no mapping file.
+    """
+    resource = files("access_moppy.mappings").joinpath(f"{model_id}_mappings.json")
+
+    all_mappings = {}
+    if resource.is_file():
+        # Read the resource directly rather than materialising it with as_file
+        if orjson is not None:
+            all_mappings = orjson.loads(resource.read_bytes())
+        else:
+            all_mappings = json.loads(resource.read_text(encoding="utf-8"))
+
+    # Fill from the lowest precedence up so earlier sections win on duplicates
+    index = {}
+    for component in reversed(_MAPPING_COMPONENTS):
+        index.update(all_mappings.get(component, {}))
+    return index
+
+
 def load_model_mappings(compound_name: str, model_id: str = None) -> Dict:
     """
     Load Mappings for ACCESS models.
@@ -29,37 +68,24 @@ def load_model_mappings(compound_name: str, model_id: str = None) -> Dict:
     Returns:
         Dictionary containing variable mappings for the requested compound name.
     """
-    _, cmor_name = compound_name.split(".")
-    mapping_dir = files("access_moppy.mappings")
+    _, sep, cmor_name = compound_name.partition(".")
+    if not sep:
+        raise ValueError(
+            f"Invalid compound name format: {compound_name}. Expected 'table.variable'"
+        )
 
     # Default to ACCESS-ESM1.6 if no model_id provided
     if model_id is None:
         model_id = "ACCESS-ESM1.6"
 
     # Load model-specific consolidated mapping
-    model_file = f"{model_id}_mappings.json"
-
-    for entry in mapping_dir.iterdir():
-        if entry.name == model_file:
-            with as_file(entry) as path:
-                with open(path, "r", encoding="utf-8") as f:
-                    all_mappings = json.load(f)
-
-                    # Search in component-organized structure
-                    for component in ["atmosphere", "land", "ocean", "time_invariant"]:
-                        if (
-                            component in all_mappings
-                            and cmor_name in all_mappings[component]
-                        ):
-                            return {cmor_name: all_mappings[component][cmor_name]}
-
-                    # Fallback: search in flat "variables" structure (for backward compatibility)
-                    variables = all_mappings.get("variables", {})
-                    if cmor_name in variables:
-                        return {cmor_name: variables[cmor_name]}
+    index = _load_mapping_index(model_id)
 
     # If model file not found or variable not found, return empty dict
-    return {}
+    if cmor_name not in index:
+        return {}
+    # Copy so callers cannot modify the cached mapping
+    return {cmor_name: copy.deepcopy(index[cmor_name])}
 
 
 class FrequencyMismatchError(ValueError):
@@ -80,6 +106,42 @@ class ResamplingRequiredWarning(UserWarning):
     pass
 
 
+# Map CMIP6 table IDs to their frequencies
+_CMIP6_TABLE_FREQ = {
+    # Common atmospheric tables
+    "Amon": pd.Timedelta(days=30),  # Monthly (approximate)
+    "Aday": pd.Timedelta(days=1),  # Daily
+    "A3hr": pd.Timedelta(hours=3),  # 3-hourly
+    "A6hr": pd.Timedelta(hours=6),  # 6-hourly
+    "AsubhR": pd.Timedelta(minutes=30),  # Sub-hourly
+    # Ocean tables
+    "Omon": pd.Timedelta(days=30),  # Monthly ocean
+    "Oday": pd.Timedelta(days=1),  # Daily ocean
+    "Oyr": pd.Timedelta(days=365),  # Yearly ocean
+    # Land tables
+    "Lmon": pd.Timedelta(days=30),  # Monthly land
+    "Lday": pd.Timedelta(days=1),  # Daily land
+    # Sea ice tables
+    "SImon": pd.Timedelta(days=30),  # Monthly sea ice
+    "SIday": pd.Timedelta(days=1),  # Daily sea ice
+    # Additional frequency tables
+    "3hr": pd.Timedelta(hours=3),
+    "6hr": pd.Timedelta(hours=6),
+    "day": pd.Timedelta(days=1),
+    "mon": pd.Timedelta(days=30),
+    "yr": pd.Timedelta(days=365),
+    # CF standard tables
+    "CFday": pd.Timedelta(days=1),
+    "CFmon": pd.Timedelta(days=30),
+    "CF3hr": pd.Timedelta(hours=3),
+    "CFsubhr": pd.Timedelta(minutes=30),
+    # Specialized tables
+    "6hrLev": pd.Timedelta(hours=6),
+    "6hrPlev": pd.Timedelta(hours=6),
+    "6hrPlevPt": pd.Timedelta(hours=6),
+}
+
+
 def parse_cmip6_table_frequency(compound_name: str) -> pd.Timedelta:
     """
     Parse CMIP6 table frequency from compound name.
@@ -93,9 +155,8 @@ def parse_cmip6_table_frequency(compound_name: str) -> pd.Timedelta:
     Raises:
         ValueError: if compound name format is invalid or frequency not recognized
     """
-    try:
-        table_id, variable = compound_name.split(".")
-    except ValueError:
+    table_id, sep, variable = compound_name.partition(".")
+    if not sep or "." in variable:
         raise ValueError(
             f"Invalid compound name format: {compound_name}. Expected 'table.variable'"
         )
@@ -106,47 +167,12 @@ def parse_cmip6_table_frequency(compound_name: str) -> pd.Timedelta:
             f"Invalid compound name format: {compound_name}. Both table and variable must be non-empty."
         )
 
-    # Map CMIP6 table IDs to their frequencies
-    frequency_mapping = {
-        # Common atmospheric tables
-        "Amon": pd.Timedelta(days=30),  # Monthly (approximate)
-        "Aday": pd.Timedelta(days=1),  # Daily
-        "A3hr": pd.Timedelta(hours=3),  # 3-hourly
-        "A6hr": pd.Timedelta(hours=6),  # 6-hourly
-        "AsubhR": pd.Timedelta(minutes=30),  # Sub-hourly
-        # Ocean tables
-        "Omon": pd.Timedelta(days=30),  # Monthly ocean
-        "Oday": pd.Timedelta(days=1),  # Daily ocean
-        "Oyr": pd.Timedelta(days=365),  # Yearly ocean
-        # Land tables
-        "Lmon": pd.Timedelta(days=30),  # Monthly land
-        "Lday": pd.Timedelta(days=1),  # Daily land
-        # Sea ice tables
-        "SImon": pd.Timedelta(days=30),  # Monthly sea ice
-        "SIday": pd.Timedelta(days=1),  # Daily sea ice
-        # Additional frequency tables
-        "3hr": pd.Timedelta(hours=3),
-        "6hr": pd.Timedelta(hours=6),
-        "day": pd.Timedelta(days=1),
-        "mon": pd.Timedelta(days=30),
-        "yr": pd.Timedelta(days=365),
-        # CF standard tables
-        "CFday": pd.Timedelta(days=1),
-        "CFmon": pd.Timedelta(days=30),
-        "CF3hr": pd.Timedelta(hours=3),
-        "CFsubhr": pd.Timedelta(minutes=30),
-        # Specialized tables
-        "6hrLev": pd.Timedelta(hours=6),
-        "6hrPlev": pd.Timedelta(hours=6),
-        "6hrPlevPt": pd.Timedelta(hours=6),
-    }
-
-    if table_id not in frequency_mapping:
+    try:
+        return _CMIP6_TABLE_FREQ[table_id]
+    except KeyError:
         raise ValueError(
             f"Unknown CMIP6 table ID: {table_id}. Cannot determine target frequency."
-        )
-
-    return frequency_mapping[table_id]
+        ) from None
 
 
 def is_frequency_compatible(
@@ -194,16 +220,17 @@ def is_frequency_compatible(
         return True, "Frequencies match exactly"
     elif input_seconds < target_seconds:
         # Input is more frequent (higher resolution) - can be averaged down
-        ratio = target_seconds / input_seconds
-        if ratio == int(ratio):  # Clean integer ratio
+        # Compare integer nanoseconds to avoid floating point ratio checks
+        ratio, remainder = divmod(target_freq.value, input_freq.value)
+        if remainder == 0:  # Clean integer ratio
             return (
                 True,
-                f"Input frequency ({input_freq}) can be averaged to target frequency ({target_freq}) with ratio 1:{int(ratio)}",
+                f"Input frequency ({input_freq}) can be averaged to target frequency ({target_freq}) with ratio 1:{ratio}",
             )
         else:
             return (
                 True,
-                f"Input frequency ({input_freq}) can be resampled to target frequency ({target_freq}) with ratio 1:{ratio:.2f}",
+                f"Input frequency ({input_freq}) can be resampled to target frequency ({target_freq}) with ratio 1:{target_seconds / input_seconds:.2f}",
             )
     else:
         # Input is less frequent (lower resolution) - cannot be upsampled meaningfully
@@ -213,11 +240,33 @@ def is_frequency_compatible(
         )
 
 
+_MONTHLY_TABLES = frozenset({"Amon", "Lmon", "Omon", "SImon", "CFmon", "mon"})
+
+
 def _is_monthly_target(compound_name: str) -> bool:
     """Check if CMIP6 compound name represents monthly data."""
-    table_id, _ = compound_name.split(".")
-    monthly_tables = {"Amon", "Lmon", "Omon", "SImon", "CFmon", "mon"}
-    return table_id in monthly_tables
+    return compound_name.partition(".")[0] in _MONTHLY_TABLES
+
+
+def _select_time_variables(ds: xr.Dataset, time_coord: str = "time") -> xr.Dataset:
+    """
+    Keep only the time coordinate and its bounds, so that files can be
+    concatenated without comparing or loading any of their data variables.
+    """
+    if time_coord not in ds.variables:
+        return ds
+    bounds_name = ds[time_coord].attrs.get("bounds")
+    keep = [
+        name
+        for name, var in ds.variables.items()
+        if name == time_coord
+        or (
+            (name == bounds_name or "bnd" in name or "bound" in name)
+            and var.ndim == 2
+            and var.dims[0] == time_coord
+        )
+    ]
+    return ds[keep]
 
 
 def _detect_frequency_from_concatenated_files(
@@ -283,6 +332,7 @@ def _detect_frequency_from_concatenated_files(
             combine="nested",
             data_vars="minimal",  # Only load coordinate variables
             coords="minimal",
+            preprocess=functools.partial(_select_time_variables, time_coord=time_coord),
         ) as mf_ds:
             # Detect frequency from the concatenated time coordinate
             detected_freq = detect_time_frequency_lazy(mf_ds, time_coord)
@@ -322,13 +372,12 @@ def _detect_frequency_from_individual_files(
     # Detect frequency from each file
     for file_path in file_paths:
         try:
-            with xr.open_dataset(file_path, decode_cf=False, chunks={}) as ds:
-                freq = detect_time_frequency_lazy(ds, time_coord)
-                if freq is not None:
-                    frequencies.append(freq)
-                    file_info.append((file_path, freq))
-                else:
-                    warnings.warn(f"Could not detect frequency for file: {file_path}")
+            freq = _detect_file_frequency(file_path, time_coord)
+            if freq is not None:
+                frequencies.append(freq)
+                file_info.append((file_path, freq))
+            else:
+                warnings.warn(f"Could not detect frequency for file: {file_path}")
         except Exception as e:
             warnings.warn(f"Error processing file {file_path}: {e}")
             continue
@@ -401,13 +450,12 @@ def _validate_monthly_files_individually(
     # Detect frequency from each file
     for file_path in file_paths:
         try:
-            with xr.open_dataset(file_path, decode_cf=False, chunks={}) as ds:
-                freq = detect_time_frequency_lazy(ds, time_coord)
-                if freq is not None:
-                    frequencies.append(freq)
-                    file_info.append((file_path, freq))
-                else:
-                    warnings.warn(f"Could not detect frequency for file: {file_path}")
+            freq = _detect_file_frequency(file_path, time_coord)
+            if freq is not None:
+                frequencies.append(freq)
+                file_info.append((file_path, freq))
+            else:
+                warnings.warn(f"Could not detect frequency for file: {file_path}")
         except Exception as e:
             warnings.warn(f"Error processing file {file_path}: {e}")
             continue
@@ -449,25 +497,18 @@ def _validate_monthly_files_individually(
     return representative_freq
 
 
-def validate_cmip6_frequency_compatibility(
+def check_cmip6_frequency_compatibility(
     file_paths: Union[str, List[str]],
     compound_name: str,
     time_coord: str = "time",
     tolerance_seconds: float = None,  # Auto-determined based on detected frequency
-    interactive: bool = True,
-) -> tuple[pd.Timedelta, bool]:
+) -> tuple[pd.Timedelta, bool, Optional[str]]:
     """
-    Validate that input files have compatible frequency with CMIP6 target frequency.
+    Check that input files have compatible frequency with CMIP6 target frequency.
 
-    This function:
-    1. Validates frequency consistency across input files (with special handling for monthly data)
-    2. Parses target frequency from CMIP6 compound name
-    3. Checks compatibility and determines if resampling is needed
-    4. Optionally prompts user for confirmation when resampling is required
-
-    For monthly CMIP6 tables (Amon, Lmon, Omon, etc.), this function recognizes that
-    individual monthly files have different calendar lengths (28-31 days) and validates
-    them appropriately.
+    This is the non-interactive part of
+    :func:`validate_cmip6_frequency_compatibility`: it never prompts, so it can
+    be used from batch jobs and worker processes.
 
     Args:
         file_paths: Path or list of paths to NetCDF files
@@ -475,10 +516,10 @@ def validate_cmip6_frequency_compatibility(
         time_coord: name of the time coordinate (default: "time")
         tolerance_seconds: tolerance for frequency differences in seconds.
                           If None (default), automatically determined based on frequency.
-        interactive: whether to prompt user when resampling is needed
 
     Returns:
-        tuple of (detected_frequency, resampling_required)
+        tuple of (detected_frequency, resampling_required, message), where
+        message describes the required resampling, or is None if none is needed
 
     Raises:
         FrequencyMismatchError: if files have inconsistent frequencies
@@ -494,7 +535,8 @@ def validate_cmip6_frequency_compatibility(
         )
 
     # Check if this is monthly data
-    if _is_monthly_target(compound_name):
+    is_monthly = _is_monthly_target(compound_name)
+    if is_monthly:
         # Use monthly-aware validation that allows calendar variations
         print(
             f"🗓️  Monthly CMIP6 table detected ({compound_name}) - using calendar-aware validation"
@@ -509,14 +551,6 @@ def validate_cmip6_frequency_compatibility(
             file_paths, time_coord, tolerance_seconds
         )
 
-    # Parse target frequency from compound name
-    try:
-        target_freq = parse_cmip6_table_frequency(compound_name)
-    except ValueError as e:
-        raise ValueError(
-            f"Cannot determine target frequency from compound name '{compound_name}': {e}"
-        )
-
     # Check compatibility
     is_compatible, reason = is_frequency_compatible(detected_freq, target_freq)
 
@@ -536,7 +570,7 @@ def validate_cmip6_frequency_compatibility(
     target_seconds = target_freq.total_seconds()
 
     # Special handling for monthly data - no resampling needed if both are monthly
-    if _is_monthly_target(compound_name):
+    if is_monthly:
         # For monthly CMIP6 tables, calendar month variations (28-31 days) are natural
         # and do not require resampling - the data is already at the correct temporal resolution
         resampling_required = False
@@ -549,6 +583,7 @@ def validate_cmip6_frequency_compatibility(
             abs(input_seconds - target_seconds) / target_seconds > 0.01
         )
 
+    message = None
     if resampling_required:
         message = (
             f"⚠️  TEMPORAL RESAMPLING REQUIRED ⚠️\n\n"
@@ -560,19 +595,74 @@ def validate_cmip6_frequency_compatibility(
             f"This is a common and valid operation for CMIP6 data preparation.\n"
         )
 
+    return detected_freq, resampling_required, message
+
+
+def confirm_resampling_interactively(message: str) -> None:
+    """
+    Show a resampling message and ask the user whether to continue.
+
+    Raises:
+        InterruptedError: if the user does not confirm
+    """
+    print(message)
+    response = (
+        input("Do you want to continue with temporal resampling? [y/N]: ")
+        .strip()
+        .lower()
+    )
+    if response not in ["y", "yes"]:
+        raise InterruptedError(
+            "CMORisation aborted by user due to temporal resampling requirement. "
+            "To proceed non-interactively, set interactive=False or validate_frequency=False."
+        )
+    print("✓ Proceeding with temporal resampling...")
+
+
+def validate_cmip6_frequency_compatibility(
+    file_paths: Union[str, List[str]],
+    compound_name: str,
+    time_coord: str = "time",
+    tolerance_seconds: float = None,  # Auto-determined based on detected frequency
+    interactive: bool = True,
+) -> tuple[pd.Timedelta, bool]:
+    """
+    Validate that input files have compatible frequency with CMIP6 target frequency.
+
+    This function:
+    1. Validates frequency consistency across input files (with special handling for monthly data)
+    2. Parses target frequency from CMIP6 compound name
+    3. Checks compatibility and determines if resampling is needed
+    4. Optionally prompts user for confirmation when resampling is required
+
+    For monthly CMIP6 tables (Amon, Lmon, Omon, etc.), this function recognizes that
+    individual monthly files have different calendar lengths (28-31 days) and validates
+    them appropriately.
+
+    Args:
+        file_paths: Path or list of paths to NetCDF files
+        compound_name: CMIP6 compound name (e.g., 'Amon.tas')
+        time_coord: name of the time coordinate (default: "time")
+        tolerance_seconds: tolerance for frequency differences in seconds.
+                          If None (default), automatically determined based on frequency.
+        interactive: whether to prompt user when resampling is needed
+
+    Returns:
+        tuple of (detected_frequency, resampling_required)
+
+    Raises:
+        FrequencyMismatchError: if files have inconsistent frequencies
+        IncompatibleFrequencyError: if input frequency cannot be resampled to target
+        ValueError: if compound name is invalid
+        InterruptedError: if the user declines resampling in interactive mode
+    """
+    detected_freq, resampling_required, message = check_cmip6_frequency_compatibility(
+        file_paths, compound_name, time_coord, tolerance_seconds
+    )
+
+    if resampling_required:
         if interactive:
-            print(message)
-            response = (
-                input("Do you want to continue with temporal resampling? [y/N]: ")
-                .strip()
-                .lower()
-            )
-            if response not in ["y", "yes"]:
-                raise InterruptedError(
-                    "CMORisation aborted by user due to temporal resampling requirement. "
-                    "To proceed non-interactively, set interactive=False or validate_frequency=False."
-                )
-            print("✓ Proceeding with temporal resampling...")
+            confirm_resampling_interactively(message)
         else:
             # Non-interactive mode - just warn
             warnings.warn(message, ResamplingRequiredWarning, stacklevel=2)
@@ -704,6 +794,28 @@ def _detect_frequency_from_access_metadata(ds: xr.Dataset) -> Optional[pd.Timede
     return None
 
 
+# Seconds per CF time unit, for "<unit> since <epoch>" time coordinates
+_TIME_UNIT_SECONDS = {
+    **dict.fromkeys(("days", "day", "d"), 86400.0),
+    **dict.fromkeys(("hours", "hour", "hrs", "hr", "h"), 3600.0),
+    **dict.fromkeys(("minutes", "minute", "mins", "min"), 60.0),
+    **dict.fromkeys(("seconds", "second", "secs", "sec", "s"), 1.0),
+}
+_TIME_UNITS_RE = re.compile(r"^\s*(\w+)\s+since\s")
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_time_units(units: str) -> Optional[float]:
+    """
+    Return the length in seconds of one step of a "<unit> since <epoch>" time
+    unit, or None if the unit is not a fixed-length one.
+    """
+    match = _TIME_UNITS_RE.match(units)
+    if match is None:
+        return None
+    return _TIME_UNIT_SECONDS.get(match.group(1).lower())
+
+
 def detect_time_frequency_lazy(
     ds: xr.Dataset, time_coord: str = "time"
 ) -> Optional[pd.Timedelta]:
@@ -775,9 +887,20 @@ def detect_time_frequency_lazy(
 
         # Check if values are already datetime64 (even if units suggest otherwise)
         if np.issubdtype(time_sample.values.dtype, np.datetime64):
-            # Already datetime64 - use directly
+            # Already datetime64 - evenly spaced samples give the frequency
+            # directly; irregular ones (e.g. calendar months) go through pandas
+            time_diffs = np.diff(time_sample.values)
+            if (time_diffs == time_diffs[0]).all():
+                return pd.Timedelta(time_diffs[0])
             time_index = pd.to_datetime(time_sample.values)
         elif units and "since" in units:
+            # Time steps are linear in fixed-length units, so the median numeric
+            # difference gives the frequency without decoding any dates
+            unit_seconds = _parse_time_units(units)
+            if unit_seconds is not None:
+                diffs = np.diff(time_sample.values.astype(np.float64))
+                return pd.Timedelta(seconds=float(np.median(diffs)) * unit_seconds)
+
             # Convert from numeric time to datetime
             try:
                 dates = num2date(
@@ -787,23 +910,13 @@ def detect_time_frequency_lazy(
                     only_use_cftime_datetimes=False,
                 )
                 # Convert to pandas datetime if possible for better frequency inference
-                if hasattr(dates[0], "strftime"):  # Standard datetime
+                if isinstance(dates[0], datetime):  # Standard datetime
+                    time_index = pd.to_datetime(np.asarray(dates))
+                else:  # cftime datetime
+                    # pandas can't take cftime objects directly
                     time_index = pd.to_datetime(
                         [d.strftime("%Y-%m-%d %H:%M:%S") for d in dates]
                     )
-                else:  # cftime datetime
-                    # For cftime objects, use a more manual approach
-                    time_diffs = []
-                    for i in range(1, len(dates)):
-                        diff = dates[i] - dates[i - 1]
-                        # Convert to total seconds
-                        total_seconds = diff.days * 86400 + diff.seconds
-                        time_diffs.append(total_seconds)
-
-                    if time_diffs:
-                        avg_seconds = np.mean(time_diffs)
-                        return pd.Timedelta(seconds=avg_seconds)
-                    return None
             except (ValueError, OverflowError) as e:
                 # If numeric conversion fails, try treating as datetime64
                 if np.issubdtype(time_sample.values.dtype, np.datetime64):
@@ -821,19 +934,14 @@ def detect_time_frequency_lazy(
                 # Convert frequency string to Timedelta
                 try:
                     offset = pd.tseries.frequencies.to_offset(freq)
-                    # For some offsets like MonthBegin, we need to estimate the timedelta
-                    if hasattr(offset, "delta") and offset.delta is not None:
-                        return pd.Timedelta(offset.delta)
-                    elif "M" in freq:  # Monthly frequencies
-                        # Use actual time differences for monthly data
-                        time_diffs = time_index[1:] - time_index[:-1]
-                        avg_diff = time_diffs.mean()
-                        return pd.Timedelta(avg_diff)
-                    elif "Y" in freq:  # Yearly frequencies
-                        # Use actual time differences for yearly data
-                        time_diffs = time_index[1:] - time_index[:-1]
-                        avg_diff = time_diffs.mean()
-                        return pd.Timedelta(avg_diff)
+                    # Fixed-length offsets (days, hours, ...) convert directly;
+                    # Tick.delta is deprecated and gone in pandas 3
+                    if isinstance(offset, pd.tseries.offsets.Tick):
+                        return pd.Timedelta(offset)
+                    elif "M" in freq or "Y" in freq:  # Monthly/yearly frequencies
+                        # Calendar offsets have no fixed length: use the mean
+                        # of the actual time differences
+                        return pd.Timedelta(np.diff(time_index.values).mean())
                     else:
                         # Try to convert directly for simple frequencies
                         return pd.Timedelta(offset)
@@ -842,7 +950,9 @@ def detect_time_frequency_lazy(
                     pass
 
             # Manual frequency calculation if pandas can't infer or convert
-            time_diffs = time_index[1:] - time_index[:-1]
+            time_diffs = np.asarray(time_index[1:] - time_index[:-1])
+            if (time_diffs == time_diffs[0]).all():
+                return pd.Timedelta(time_diffs[0])
             # Use the most common difference as the frequency
             unique_diffs, counts = np.unique(time_diffs, return_counts=True)
             most_common_diff = unique_diffs[np.argmax(counts)]
@@ -856,6 +966,61 @@ def detect_time_frequency_lazy(
     return None
 
 
+def _detect_file_frequency(
+    file_path: str, time_coord: str = "time"
+) -> Optional[pd.Timedelta]:
+    """
+    Detect the temporal frequency of a single file.
+
+    Results are cached per file path, modification time and size, so the same
+    files validated again for another variable are not re-read.
+    """
+    st = os.stat(file_path)
+    return _probe_file_frequency(
+        os.fspath(file_path), st.st_mtime_ns, st.st_size, time_coord
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _probe_file_frequency(
+    file_path: str, mtime_ns: int, size: int, time_coord: str
+) -> Optional[pd.Timedelta]:
+    """
+    Read a file's time metadata and detect its frequency.
+
+    Only the global attributes and the leading values of the time coordinate
+    and any time bounds are read, directly with netCDF4, instead of opening the
+    whole file with xarray. ``mtime_ns`` and ``size`` are only part of the cache key.
+    """
+    with nc.Dataset(file_path) as src:
+        # Raw values, as with decode_cf=False
+        src.set_auto_maskandscale(False)
+        coords = {}
+        data_vars = {}
+        time_var = src.variables.get(time_coord)
+        if time_var is not None:
+            # Detection samples at most the first 10 time steps, so read no more
+            coords[time_coord] = (
+                time_var.dimensions,
+                time_var[:10],
+                time_var.__dict__,
+            )
+            for name, var in src.variables.items():
+                # Time bounds: (time, 2) variables named *bnd* / *bound*
+                is_bounds = name == time_var.__dict__.get("bounds") or (
+                    "bnd" in name or "bound" in name
+                )
+                if (
+                    name != time_coord
+                    and is_bounds
+                    and var.ndim == 2
+                    and var.dimensions[0] == time_var.dimensions[0]
+                ):
+                    data_vars[name] = (var.dimensions, var[:10], var.__dict__)
+        ds = xr.Dataset(data_vars, coords=coords, attrs=src.__dict__)
+    return detect_time_frequency_lazy(ds, time_coord)
+
+
 def _detect_frequency_from_bounds(
     ds: xr.Dataset, time_coord: str = "time"
 ) -> Optional[pd.Timedelta]:
@@ -1121,14 +1286,13 @@ def _validate_frequency_consistency_detailed(
 
     for file_path in file_paths:
         try:
-            # Open file lazily - no data is loaded into memory here
-            with xr.open_dataset(file_path, decode_cf=False, chunks={}) as ds:
-                freq = detect_time_frequency_lazy(ds, time_coord)
-                if freq is not None:
-                    frequencies.append(freq)
-                    file_info.append((file_path, freq))
-                else:
-                    warnings.warn(f"Could not detect frequency for file: {file_path}")
+            # Only time metadata is read - no data variables are loaded here
+            freq = _detect_file_frequency(file_path, time_coord)
+            if freq is not None:
+                frequencies.append(freq)
+                file_info.append((file_path, freq))
+            else:
+                warnings.warn(f"Could not detect frequency for file: {file_path}")
 
         except Exception as e:
             warnings.warn(f"Error processing file {file_path}: {e}")
@@ -10,7 +10,9 @@ import subprocess  # nosec
 from pathlib import Path
 from tempfile import gettempdir
 
+import numpy as np
 import pytest
+import xarray as xr
 
 import access_moppy.vocabularies.cmip6_cmor_tables.Tables as cmor_tables
 from access_moppy import ACCESS_ESM_CMORiser
@@ -51,6 +53,40 @@ class TestEndToEnd:
         output_file = output_files[0]
         assert output_file.name.startswith("tas_Amon_ACCESS-ESM1-5_historical")
 
+    @pytest.mark.skipif(
+        not Path("tests/data/esm1-6/atmosphere/aiihca.pa-101909_mon.nc").exists(),
+        reason="Test data file not available",
+    )
+    def test_real_file_processing_zarr(self, parent_experiment_config, temp_dir):
+        """Test that run(write_output="zarr") writes a readable Zarr store."""
+        pytest.importorskip("zarr")
+        test_file = Path("tests/data/esm1-6/atmosphere/aiihca.pa-101909_mon.nc")
+
+        cmoriser = ACCESS_ESM_CMORiser(
+            input_paths=test_file,
+            compound_name="Amon.tas",
+            experiment_id="historical",
+            source_id="ACCESS-ESM1-5",
+            variant_label="r1i1p1f1",
+            grid_label="gn",
+            activity_id="CMIP",
+            parent_info=parent_experiment_config,
+            output_path=temp_dir,
+        )
+
+        cmoriser.run(write_output="zarr")
+
+        output_stores = list(temp_dir.glob("tas_Amon_*.zarr"))
+        assert len(output_stores) == 1, "No Zarr store generated"
+        assert not list(temp_dir.glob("*.nc"))
+
+        expected = cmoriser.cmoriser.ds["tas"]
+        with xr.open_zarr(output_stores[0], decode_cf=False) as ds:
+            np.testing.assert_array_equal(ds["tas"].values, expected.values)
+            assert tuple(ds["tas"].encoding["chunks"]) == tuple(
+                cmoriser.cmoriser._chunksizes(expected)
+            )
+
     @pytest.mark.slow
     @pytest.mark.skipif(
         not Path("tests/data/esm1-6/atmosphere/aiihca.pa-101909_mon.nc").exists(),
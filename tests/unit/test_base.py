@@ -8,7 +8,10 @@ without requiring complex dependencies or data files.
 from pathlib import Path
 from unittest.mock import Mock
 
+import netCDF4 as nc
+import numpy as np
 import pytest
+import xarray as xr
 
 from access_moppy.base import CMIP6_CMORiser
 
@@ -130,7 +133,7 @@ class TestCMIP6CMORiser:
         """Test that the CMORiser can proxy dataset operations."""
         # Create a mock dataset
         mock_dataset = Mock()
-        mock_dataset.test_attr = "test_value"
+        mock_dataset.attrs = {"test_attr": "test_value"}
         mock_dataset.__getitem__ = Mock(return_value="dataset_item")
         mock_dataset.__setitem__ = Mock()
         mock_dataset.__repr__ = Mock(return_value="<Dataset representation>")
@@ -152,7 +155,11 @@ class TestCMIP6CMORiser:
         mock_dataset.__getitem__.assert_called_with("test_key")
 
         # Test __getattr__ proxy
-        assert cmoriser.test_attr == "test_value"
+        assert cmoriser.attrs == {"test_attr": "test_value"}
+
+        # Only whitelisted dataset attributes are forwarded
+        with pytest.raises(AttributeError):
+            _ = cmoriser.test_attr
 
         # Test __setitem__ proxy
         cmoriser["new_key"] = "new_value"
@@ -189,3 +196,188 @@ class TestCMIP6CMORiser:
         # When ds is None, getattr should raise AttributeError
         with pytest.raises(AttributeError):
             _ = cmoriser.nonexistent_attribute
+
+    @pytest.fixture
+    def output_dataset(self):
+        """Small CMORised-looking dataset with undecoded, packed data."""
+        return xr.Dataset(
+            {
+                "tas": (
+                    ("time", "lat"),
+                    np.array([[1, 2], [3, 4], [5, 6]], dtype="int16"),
+                    {"scale_factor": 0.5, "_FillValue": np.int16(-999)},
+                )
+            },
+            coords={
+                "time": (
+                    "time",
+                    [15.5, 45.0, 74.5],
+                    {"units": "days since 2000-01-01", "calendar": "noleap"},
+                ),
+                "lat": ("lat", [-45.0, 45.0]),
+            },
+            attrs={
+                "variable_id": "tas",
+                "table_id": "Amon",
+                "source_id": "ACCESS-ESM1-5",
+                "experiment_id": "historical",
+                "variant_label": "r1i1p1f1",
+                "grid_label": "gn",
+            },
+        )
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("write_block_bytes", [1e9, 1])
+    @pytest.mark.parametrize("in_memory", [False, True])
+    def test_write_keeps_packed_values(
+        self,
+        mock_vocab,
+        mock_mapping,
+        temp_dir,
+        output_dataset,
+        write_block_bytes,
+        in_memory,
+    ):
+        """Test that write() stores undecoded data as-is, in one or several blocks."""
+        cmoriser = CMIP6_CMORiser(
+            input_paths=["test.nc"],
+            output_path=str(temp_dir),
+            cmip6_vocab=mock_vocab,
+            variable_mapping=mock_mapping,
+            compound_name="Amon.tas",
+        )
+        cmoriser.ds = output_dataset.chunk({"time": 1})
+        cmoriser.write_block_bytes = write_block_bytes
+
+        cmoriser.write(in_memory=in_memory)
+
+        output = (
+            temp_dir / "tas_Amon_ACCESS-ESM1-5_historical_r1i1p1f1_gn_200001-200003.nc"
+        )
+        with nc.Dataset(output) as ds:
+            ds.set_auto_maskandscale(False)
+            np.testing.assert_array_equal(ds["tas"][:], [[1, 2], [3, 4], [5, 6]])
+            assert ds["tas"].scale_factor == 0.5
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("unlimited_time", [True, False])
+    @pytest.mark.parametrize("from_netcdf", [False, True])
+    def test_write_time_dimension(
+        self,
+        mock_vocab,
+        mock_mapping,
+        temp_dir,
+        output_dataset,
+        unlimited_time,
+        from_netcdf,
+    ):
+        """Test that write() creates time as unlimited or fixed as requested."""
+        if from_netcdf:
+            # netCDF-C chunks 1-D variables along an unlimited time as [512]
+            source = temp_dir / "source.nc"
+            output_dataset.to_netcdf(source, unlimited_dims=["time"])
+            output_dataset = xr.open_dataset(source, decode_cf=False)
+        cmoriser = CMIP6_CMORiser(
+            input_paths=["test.nc"],
+            output_path=str(temp_dir),
+            cmip6_vocab=mock_vocab,
+            variable_mapping=mock_mapping,
+            compound_name="Amon.tas",
+            unlimited_time=unlimited_time,
+        )
+        cmoriser.ds = output_dataset
+
+        cmoriser.write()
+
+        output = (
+            temp_dir / "tas_Amon_ACCESS-ESM1-5_historical_r1i1p1f1_gn_200001-200003.nc"
+        )
+        with nc.Dataset(output) as ds:
+            assert ds.dimensions["time"].isunlimited() is unlimited_time
+            assert len(ds.dimensions["time"]) == 3
+
+    @pytest.mark.unit
+    def test_load_dataset_warns_on_empty_files(
+        self, mock_vocab, mock_mapping, temp_dir, output_dataset
+    ):
+        """Test that zero-byte input files are skipped with a warning."""
+        source = temp_dir / "source.nc"
+        output_dataset.to_netcdf(source)
+        empty = temp_dir / "empty.nc"
+        empty.touch()
+
+        cmoriser = CMIP6_CMORiser(
+            input_paths=[str(source), str(empty)],
+            output_path=str(temp_dir),
+            cmip6_vocab=mock_vocab,
+            variable_mapping=mock_mapping,
+            compound_name="Amon.tas",
+        )
+
+        with pytest.warns(UserWarning, match="empty.nc"):
+            cmoriser.load_dataset()
+
+        assert cmoriser.ds.sizes["time"] == 3
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "calendar, units, match",
+        [
+            ("noleap", "days since 2000-01-01", None),
+            ("proleptic_gregorian", "days since 2000-01-01", None),
+            ("foo", "days since 2000-01-01", "Failed calendar check"),
+            ("standard", "days since ?", "Failed calendar check"),
+        ],
+    )
+    def test_check_calendar(
+        self, mock_vocab, mock_mapping, temp_dir, output_dataset, calendar, units, match
+    ):
+        """Test that _check_calendar() rejects bad calendars, units and dates."""
+        cmoriser = CMIP6_CMORiser(
+            input_paths=["test.nc"],
+            output_path=str(temp_dir),
+            cmip6_vocab=mock_vocab,
+            variable_mapping=mock_mapping,
+            compound_name="Amon.tas",
+        )
+        cmoriser.ds = output_dataset
+        cmoriser.ds["time"].attrs.update(calendar=calendar, units=units)
+
+        if match is None:
+            cmoriser._check_calendar("time")
+        else:
+            with pytest.raises(ValueError, match=match):
+                cmoriser._check_calendar("time")
+
+    @pytest.mark.unit
+    def test_write_zarr_from_netcdf_source(
+        self, mock_vocab, mock_mapping, temp_dir, output_dataset
+    ):
+        """Test write_zarr() with a dataset still carrying its netCDF encoding."""
+        pytest.importorskip("zarr")
+        source = temp_dir / "source.nc"
+        output_dataset.to_netcdf(
+            source, unlimited_dims=["time"], encoding={"tas": {"zlib": True}}
+        )
+
+        cmoriser = CMIP6_CMORiser(
+            input_paths=[str(source)],
+            output_path=str(temp_dir),
+            cmip6_vocab=mock_vocab,
+            variable_mapping=mock_mapping,
+            compound_name="Amon.tas",
+        )
+        cmoriser.ds = xr.open_dataset(source, decode_cf=False)
+
+        cmoriser.write_zarr()
+
+        output = (
+            temp_dir
+            / "tas_Amon_ACCESS-ESM1-5_historical_r1i1p1f1_gn_200001-200003.zarr"
+        )
+        with xr.open_zarr(output, decode_cf=False) as ds:
+            np.testing.assert_array_equal(ds["tas"].values, [[1, 2], [3, 4], [5, 6]])
+            assert ds["tas"].attrs["scale_factor"] == 0.5
+            # The source's (time, lat) chunking is kept in the store
+            assert tuple(ds["tas"].encoding["chunks"]) == (1, 2)
+            np.testing.assert_array_equal(ds["time"].values, [15.5, 45.0, 74.5])
@@ -16,6 +16,7 @@ from access_moppy.utilities import (
     IncompatibleFrequencyError,
     _detect_frequency_from_access_metadata,
     _parse_access_frequency_metadata,
+    check_cmip6_frequency_compatibility,
     detect_time_frequency_lazy,
     is_frequency_compatible,
     parse_cmip6_table_frequency,
@@ -129,6 +130,44 @@ class TestFrequencyDetection:
         assert freq is not None
         assert 0.95 <= freq.total_seconds() / 3600 <= 1.05  # ~1 hour
 
+    @pytest.mark.parametrize(
+        "time_values, units, calendar, expected",
+        [
+            # Mid-month values in a 360-day calendar
+            (np.arange(15, 360, 30), "days since 1019-01-01", "360_day", 30 * 86400),
+            # Noleap months: the median difference is 31 days
+            (
+                np.cumsum([15.5, 31, 28, 31, 30, 31, 30, 31, 31, 30]),
+                "days since 0001-01-01",
+                "noleap",
+                31 * 86400,
+            ),
+            # A missing step does not change the detected frequency
+            (
+                np.array([0, 3, 6, 12, 15, 18]),
+                "hours since 2000-01-01",
+                "standard",
+                10800,
+            ),
+        ],
+    )
+    def test_detect_frequency_from_numeric_differences(
+        self, time_values, units, calendar, expected
+    ):
+        """Test coordinate-difference detection without bounds, in any calendar."""
+        ds = xr.Dataset(
+            coords={
+                "time": (
+                    ["time"],
+                    time_values.astype(float),
+                    {"units": units, "calendar": calendar},
+                )
+            }
+        )
+
+        freq = detect_time_frequency_lazy(ds)
+        assert freq == pd.Timedelta(seconds=expected)
+
     def test_insufficient_time_points(self):
         """Test handling for single time point (should warn and return None)."""
         time_values = np.array([0])  # Only 1 time point
@@ -658,6 +697,26 @@ class TestCMIP6FrequencyValidation:
             finally:
                 sys.stdin = sys.__stdin__  # Restore stdin
 
+    def test_cmip6_check_does_not_prompt(self):
+        """Test the non-interactive check returns the resampling message."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Create hourly data
+            time_values = np.arange(0, 1, 1 / 24)  # 1 day, hourly
+            ds = self.create_test_dataset(time_values)
+
+            filepath = Path(tmpdir) / "hourly.nc"
+            ds.to_netcdf(filepath)
+
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                detected_freq, resampling_required, message = (
+                    check_cmip6_frequency_compatibility([str(filepath)], "Aday.tas")
+                )
+
+            assert detected_freq == pd.Timedelta(hours=1)
+            assert resampling_required is True
+            assert "TEMPORAL RESAMPLING REQUIRED" in message
+
     def create_test_dataset(
         self, time_values, time_units="days since 2000-01-01", calendar="standard"
     ):
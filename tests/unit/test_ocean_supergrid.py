@@ -0,0 +1,168 @@
+"""
+Unit tests for supergrid downloading in access_moppy.ocean_supergrid.
+
+requests.get is replaced by a fake server so that ranged, unranged and
+failing downloads can be exercised without network access.
+"""
+
+import io
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from access_moppy import ocean_supergrid
+from access_moppy.ocean_supergrid import Supergrid, _download
+
+PAYLOAD = bytes(range(256)) * 40 + b"tail"
+
+
+class FakeResponse:
+    """Minimal streamed requests.Response."""
+
+    def __init__(self, body, status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = {"content-length": str(len(body)), **(headers or {})}
+        self.raw = io.BytesIO(body)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+    def iter_content(self, chunk_size):
+        return iter(lambda: self.raw.read(chunk_size), b"")
+
+
+def fake_server(payload, ranges=True, total_known=True, fail_from=None):
+    """
+    Return a stand-in for requests.get serving payload, optionally ignoring
+    Range headers, hiding the total size, or failing ranges from fail_from on.
+    """
+    requested = []
+
+    def get(url, stream=False, headers=None):
+        byte_range = (headers or {}).get("Range")
+        requested.append(byte_range)
+        if not byte_range or not ranges:
+            return FakeResponse(payload)
+        start, end = map(int, byte_range.removeprefix("bytes=").split("-"))
+        if fail_from is not None and start >= fail_from:
+            return FakeResponse(b"", status_code=500)
+        total = len(payload) if total_known else "*"
+        return FakeResponse(
+            payload[start : end + 1],
+            status_code=206,
+            headers={"content-range": f"bytes {start}-{end}/{total}"},
+        )
+
+    get.requested = requested
+    return get
+
+
+class TestDownload:
+    """Unit tests for _download()."""
+
+    @pytest.mark.unit
+    def test_ranged_download(self, temp_dir):
+        """Test that a file is assembled from concurrent byte ranges."""
+        dest = temp_dir / "grid.nc"
+        get = fake_server(PAYLOAD)
+
+        with patch("access_moppy.ocean_supergrid.requests.get", get):
+            _download("http://example.com/grid.nc", str(dest), workers=4)
+
+        assert dest.read_bytes() == PAYLOAD
+        # One probe for the size, then one request per range
+        assert get.requested[0] == "bytes=0-0"
+        assert len(get.requested) == 5
+
+    @pytest.mark.unit
+    def test_server_ignores_range(self, temp_dir):
+        """Test that a 200 reply to the probe is streamed as the whole file."""
+        dest = temp_dir / "grid.nc"
+        get = fake_server(PAYLOAD, ranges=False)
+
+        with patch("access_moppy.ocean_supergrid.requests.get", get):
+            _download("http://example.com/grid.nc", str(dest))
+
+        assert dest.read_bytes() == PAYLOAD
+        assert len(get.requested) == 1
+
+    @pytest.mark.unit
+    def test_unknown_total_size(self, temp_dir):
+        """Test the single-stream fallback when Content-Range has no total."""
+        dest = temp_dir / "grid.nc"
+        get = fake_server(PAYLOAD, total_known=False)
+
+        with patch("access_moppy.ocean_supergrid.requests.get", get):
+            _download("http://example.com/grid.nc", str(dest))
+
+        assert dest.read_bytes() == PAYLOAD
+        assert get.requested == ["bytes=0-0", None]
+
+    @pytest.mark.unit
+    def test_failed_range_removes_file(self, temp_dir):
+        """Test that a failing range worker leaves no full-size file behind."""
+        dest = temp_dir / "grid.nc"
+        get = fake_server(PAYLOAD, fail_from=len(PAYLOAD) // 2)
+
+        with patch("access_moppy.ocean_supergrid.requests.get", get):
+            with pytest.raises(requests.HTTPError):
+                _download("http://example.com/grid.nc", str(dest), workers=4)
+
+        assert not dest.exists()
+
+
+class TestSupergridPath:
+    """Unit tests for Supergrid.get_supergrid_path()."""
+
+    @pytest.fixture
+    def supergrid(self, temp_dir):
+        """Supergrid without a loaded file, using temporary grid directories."""
+        grid = Supergrid.__new__(Supergrid)
+        grid.nominal_resolution = "100 km"
+        with (
+            patch.object(ocean_supergrid, "GADI_GRID_DIR", temp_dir / "gadi"),
+            patch.object(ocean_supergrid, "GRID_CACHE_DIR", temp_dir / "cache"),
+        ):
+            yield grid
+
+    @pytest.mark.unit
+    def test_download_moved_into_place(self, supergrid, temp_dir):
+        """Test that a download goes to a .part file that is then renamed."""
+        dest_paths = []
+
+        def download(url, dest_path):
+            dest_paths.append(dest_path)
+            with open(dest_path, "wb") as f:
+                f.write(PAYLOAD)
+
+        with patch("access_moppy.ocean_supergrid._download", download):
+            path = supergrid.get_supergrid_path("100 km")
+
+        cache = temp_dir / "cache"
+        assert path == str(cache / "mom1deg.nc")
+        assert dest_paths == [str(cache / "mom1deg.nc.part")]
+        assert (cache / "mom1deg.nc").read_bytes() == PAYLOAD
+        assert not (cache / "mom1deg.nc.part").exists()
+
+    @pytest.mark.unit
+    def test_failed_download_not_cached(self, supergrid, temp_dir):
+        """Test that an interrupted download is not left at the grid path."""
+
+        def download(url, dest_path):
+            with open(dest_path, "wb") as f:
+                f.write(PAYLOAD[:10])
+            raise requests.ConnectionError("connection reset")
+
+        with patch("access_moppy.ocean_supergrid._download", download):
+            with pytest.raises(RuntimeError, match="connection reset"):
+                supergrid.get_supergrid_path("100 km")
+
+        assert not (temp_dir / "cache" / "mom1deg.nc").exists()
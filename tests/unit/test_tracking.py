@@ -93,3 +93,17 @@ class TestTaskTracker:
         # Task completed
         tracker.mark_completed("Amon.tas", "historical")
         assert tracker.is_done("Amon.tas", "historical")
+
+    @pytest.mark.unit
+    def test_add_tasks(self, temp_dir):
+        """Test adding several tasks at once, ignoring existing ones."""
+        db_path = temp_dir / "test_tracker.db"
+        tracker = TaskTracker(db_path)
+
+        tracker.add_task("Amon.tas", "historical")
+        tracker.mark_completed("Amon.tas", "historical")
+        tracker.add_tasks(["Amon.tas", "Amon.pr", "Omon.tos"], "historical")
+
+        assert tracker.get_status("Amon.tas", "historical") == "completed"
+        assert tracker.get_status("Amon.pr", "historical") == "pending"
+        assert tracker.get_status("Omon.tos", "historical") == "pending"